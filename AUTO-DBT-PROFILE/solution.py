@@ -2,21 +2,51 @@ import os
 import json
 import yaml
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from utils.mapper import TemplateProcessor
 from utils.dbt_project import DBTProjectGenerator
 
+try:
+    from yaml import CSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as CSafeLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+# Directory fds opened by this process, keyed on the directory path
+_dir_fds = {}
+
 config_file = "config/config.yml"
 log_dir = 'log'
-os.makedirs(log_dir, exist_ok=True)
 log_file = os.path.join(log_dir, "auto-dbt-profile.log")
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler(log_file, mode='w')
-    ],
-)
+
+def configure_logging(truncate: bool = True):
+    """
+    Sends log records to the log file. Every process, the main one
+    included, appends to the file, so records from worker processes
+    are never overwritten by a handler writing at a stale offset.
+
+    Args:
+        truncate (bool): Empty the log file first. Only the main
+            process does this; workers pass False.
+    """
+    os.makedirs(log_dir, exist_ok=True)
+    if truncate:
+        open(log_file, 'w').close()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler(log_file, mode='a')
+        ],
+    )
 
 
 def read_file(file_path: str, file_type: str) -> dict:
@@ -31,27 +61,88 @@ def read_file(file_path: str, file_type: str) -> dict:
     Returns:
         dict: Parsed contents of the file.
     """
-    if not os.path.exists(file_path):
+    try:
+        f = open(file_path, "r", encoding="utf-8")
+    except FileNotFoundError as e:
         raise FileNotFoundError(
             f"The {file_type} file not found at {file_path}"
-        )
-    with open(file_path, "r", encoding="utf-8") as f:
+        ) from e
+
+    with f:
         if file_type.lower() == 'yml':
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=CSafeLoader)
         elif file_type.lower() == 'json':
-            data = json.load(f)
+            data = orjson.loads(f.read()) if orjson else json.load(f)
         else:
             raise ValueError(
                 f"Unsupported file type: {file_type}. "
                 f"Only 'yml' and 'json' are allowed."
             )
-        logging.info(f"{file_path}: Valid {file_type} data.")
+        log.info("%s: Valid %s data.", file_path, file_type)
     return data
 
 
+def output_dir_fd(output_dir: str):
+    """
+    Opens `output_dir` once per process and returns its file descriptor,
+    so profile writes can skip resolving the directory path each time.
+
+    Args:
+        output_dir (str): Directory the profiles are written to.
+
+    Returns:
+        int: Directory file descriptor, or None where the platform
+            does not support opening files relative to one.
+    """
+    if not hasattr(os, "O_DIRECTORY") or os.open not in os.supports_dir_fd:
+        return None
+    if output_dir not in _dir_fds:
+        _dir_fds[output_dir] = os.open(
+            output_dir, os.O_RDONLY | os.O_DIRECTORY
+        )
+    return _dir_fds[output_dir]
+
+
+def close_dir_fds():
+    """
+    Closes every directory file descriptor opened by `output_dir_fd`.
+    """
+    while _dir_fds:
+        os.close(_dir_fds.popitem()[1])
+
+
+def process_one(config_file: str, dict_config_data: dict, file_path: str):
+    """
+    Renders the profile for a single input JSON file
+    and creates its DBT project structure.
+
+    Args:
+        config_file (str): Path to the main configuration YAML file.
+        dict_config_data (dict): Parsed contents of the config file.
+        file_path (str): Path to the input JSON file.
+    """
+    processor = TemplateProcessor(
+        config_file=config_file,
+        json_input_file=file_path,
+        dict_config_data=dict_config_data,
+        output_dir_fd=output_dir_fd(dict_config_data.get("output_dir")),
+    )
+
+    log.info("render_mappings to intermediate file is started!")
+    processor.render_mappings()
+    log.info("render_mappings to the file %s is success!", file_path)
+    profile_final_file = processor.create_dbt_profile()
+
+    final_dir = dict_config_data.get("final_dir")
+    dbt_structure = DBTProjectGenerator(profile_final_file, final_dir)
+    log.info("Creating the final DBT project!")
+    dbt_structure.create_project()
+    log.info("Created the final DBT project successfully!")
+
+
 def main():
     try:
-        logging.info("Config file reading!")
+        log.info("Config file reading!")
         dict_config_data = read_file(config_file, 'yml')
         input_dir = dict_config_data.get("input_dir")
         output_dir = dict_config_data.get("output_dir")
@@ -59,42 +150,49 @@ def main():
         template_file = dict_config_data.get("template_file")
         final_dir = dict_config_data.get("final_dir")
 
-        logging.info(
-            f"Config loaded: input_dir={input_dir}, "
-            f"output_dir={output_dir}, "
-            f"mapping_file={mapping_file}, "
-            f"template_file={template_file}, "
-            f"final_dir={final_dir}"
+        log.info(
+            "Config loaded: input_dir=%s, output_dir=%s, "
+            "mapping_file=%s, template_file=%s, final_dir=%s",
+            input_dir,
+            output_dir,
+            mapping_file,
+            template_file,
+            final_dir,
         )
 
         # Reading input JSON files
-        json_files = [f for f in os.listdir(input_dir) if f.endswith(".json")]
-        if not json_files:
-            logging.warning(f"No JSON files found in {input_dir}")
+        with os.scandir(input_dir) as entries:
+            file_paths = [
+                e.path
+                for e in entries
+                if e.is_file() and e.name.endswith(".json")
+            ]
+        if not file_paths:
+            log.warning("No JSON files found in %s", input_dir)
             return
 
-        # Iterate over each input JSON file
-        for filename in json_files:
-            file_path = os.path.join(input_dir, filename)
-            processor = TemplateProcessor(
-                config_file=config_file,
-                json_input_file=file_path
-            )
-
-            logging.info("render_mappings to intermediate file is started!")
-            processor.render_mappings()
-            logging.info(
-                f"render_mappings to the file {file_path} is success!"
-            )
-            profile_final_file = processor.create_dbt_profile()
+        # Opened before the pool starts so forked workers inherit it
+        output_dir_fd(output_dir)
+        process = partial(process_one, config_file, dict_config_data)
 
-            dbt_structure = DBTProjectGenerator(profile_final_file, final_dir)
-            logging.info("Creating the final DBT project!")
-            dbt_structure.create_project()
-            logging.info("Created the final DBT project successfully!")
+        # Input files are independent, so fan them out across processes
+        max_workers = min(os.cpu_count() or 1, len(file_paths))
+        if max_workers == 1:
+            for file_path in file_paths:
+                process(file_path)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=configure_logging,
+                initargs=(False,),
+            ) as executor:
+                list(executor.map(process, file_paths))
     except Exception as e:
-        logging.info(f"Last exception block in the main: {e}")
+        log.info("Last exception block in the main: %s", e)
+    finally:
+        close_dir_fds()
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
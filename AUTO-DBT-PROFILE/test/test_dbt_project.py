@@ -0,0 +1,31 @@
+import os
+import yaml
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from utils.dbt_project import DBTProjectGenerator  # noqa: E402
+
+
+def test_create_project_uses_given_profiles(tmp_path):
+    # The profile file does not exist, so reading it would raise
+    profile_file = tmp_path / "missing" / "brand_profile.yml"
+    profiles = {
+        "name": "brand",
+        "model-paths": ["models"],
+        "clean-targets": ["target", "models/generated"],
+        "target-path": "target",
+    }
+
+    generator = DBTProjectGenerator(
+        profile_file, tmp_path / "final", profiles=profiles
+    )
+    generator.create_project()
+
+    project_root = tmp_path / "final" / "brand_profile"
+    for folder in ("models", "target", "models/generated"):
+        assert (project_root / folder).is_dir()
+
+    dbt_project_file = project_root / "dbt_project.yml"
+    dbt_project = yaml.safe_load(dbt_project_file.read_text())
+    assert dbt_project == profiles
+    assert not profile_file.exists()
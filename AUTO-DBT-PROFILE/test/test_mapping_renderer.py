@@ -4,7 +4,7 @@ import yaml
 import sys
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
-from utils.mapper import TemplateProcessor  # noqa: E402
+from utils.mapper import TemplateProcessor, _emit_vars  # noqa: E402
 
 
 def test_render_mappings_and_create_profile(tmp_path):
@@ -96,3 +96,128 @@ models:
     assert actual_yaml == expected_yaml, (
         f"\nExpected:\n{expected_yaml}\n\nActual:\n{actual_yaml}"
     )
+
+
+def _make_processor(
+    tmp_path, mapping, template, input_data, input_name="input.json"
+):
+    """
+    Writes the mapping, template and input JSON under tmp_path and
+    returns a TemplateProcessor configured to use them.
+    """
+    mapping_path = tmp_path / "mapping.yml"
+    template_path = tmp_path / "template.txt"
+    input_path = tmp_path / input_name
+    config_data = {
+        "output_dir": str(tmp_path),
+        "mapping_file": str(mapping_path),
+        "template_file": str(template_path),
+    }
+
+    mapping_path.write_text(yaml.dump(mapping))
+    template_path.write_text(template)
+    input_path.write_text(json.dumps(input_data))
+
+    return TemplateProcessor(
+        config_file=str(tmp_path / "unused.yml"),
+        json_input_file=str(input_path),
+        dict_config_data=config_data,
+    )
+
+
+def test_shared_files_are_parsed_once(tmp_path):
+    first, second = (
+        _make_processor(
+            tmp_path,
+            {"brand_name": "project_name"},
+            'name: "{project_name}"\n',
+            {"brand_name": name},
+            input_name=name,
+        )
+        for name in ("first.json", "second.json")
+    )
+
+    assert first.mapping_data is second.mapping_data
+    assert first._flat_mapping is second._flat_mapping
+    assert first.template_str is second.template_str
+    assert first.input_data != second.input_data
+
+
+def test_render_mappings_collects_unknown_keys(tmp_path):
+    processor = _make_processor(
+        tmp_path,
+        {"web_tracking": "enable_web", "max_days": "max_days"},
+        "{vars_block}\n",
+        {
+            "brand_summary": "text",
+            "web_tracking": "yes",
+            "user_set_variables": {"max_days": 3, "extra": 1},
+        },
+    )
+    processor.render_mappings()
+
+    assert processor.intermediate_input == {
+        "enable_web": True,
+        "max_days": 3,
+        "unknown": {"brand_summary": "text", "extra": 1},
+    }
+
+
+def test_vars_block_keeps_value_types(tmp_path):
+    input_data = {
+        "historical_data_since": "2023-06-01",
+        "web_tracking": "yes",
+        "app_ids": ["web", "no"],
+        "user_set_variables": {
+            "max_days": 10,
+            "label": "a: b",
+            "tag": "hi \U0001F600",
+            "ratio": 1e-07,
+            "limit": 1e20,
+        },
+    }
+    mapping_data = {
+        "historical_data_since": "start_date",
+        "web_tracking": "enable_web",
+        "app_ids": "app_id",
+        "max_days": "max_days",
+        "label": "label",
+        "tag": "tag",
+        "ratio": "ratio",
+        "limit": "limit",
+    }
+
+    processor = _make_processor(
+        tmp_path,
+        mapping_data,
+        "models:\n  p:\n      {vars_block}\n",
+        input_data,
+    )
+    processor.render_mappings()
+    processor.create_dbt_profile()
+
+    output_file = tmp_path / "input_profile.yml"
+    actual_yaml = yaml.safe_load(output_file.read_text())
+    actual_vars = actual_yaml["models"]["p"]["vars"]
+    assert actual_vars == {
+        "start_date": "2023-06-01",
+        "enable_web": True,
+        "app_id": ["web", "no"],
+        "max_days": 10,
+        "label": "a: b",
+        "tag": "hi \U0001F600",
+        "ratio": 1e-07,
+        "limit": 1e20,
+    }
+    assert isinstance(actual_vars["ratio"], float)
+    assert isinstance(actual_vars["limit"], float)
+
+
+def test_emit_vars_indents_for_the_template():
+    assert _emit_vars({"app_id": ["web", "ios"], "max_days": 10}) == (
+        "        app_id:\n"
+        "          - web\n"
+        "          - ios\n"
+        "        max_days: 10\n"
+    )
+    assert _emit_vars({"app_id": []}) == "        app_id: []\n"
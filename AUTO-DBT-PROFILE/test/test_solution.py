@@ -0,0 +1,50 @@
+import os
+import json
+import yaml
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+import solution  # noqa: E402
+
+
+def test_main_processes_inputs_in_worker_pool(tmp_path, monkeypatch):
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    final_dir = tmp_path / "final"
+    config_data = {
+        "input_dir": str(input_dir),
+        "output_dir": str(output_dir),
+        "mapping_file": str(tmp_path / "mapping.yml"),
+        "template_file": str(tmp_path / "template.txt"),
+        "final_dir": str(final_dir),
+    }
+
+    input_dir.mkdir()
+    output_dir.mkdir()
+    (tmp_path / "config.yml").write_text(yaml.dump(config_data))
+    (tmp_path / "mapping.yml").write_text(
+        yaml.dump({"brand_name": "project_name"})
+    )
+    (tmp_path / "template.txt").write_text(
+        'name: "{project_name}"\nmodel-paths:\n  - models\n'
+    )
+    for name in ("first", "second"):
+        (input_dir / f"{name}.json").write_text(
+            json.dumps({"brand_name": name})
+        )
+
+    # Two inputs and two CPUs take the ProcessPoolExecutor branch
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(solution, "config_file", str(tmp_path / "config.yml"))
+    monkeypatch.setattr(solution.os, "cpu_count", lambda: 2)
+    solution.main()
+
+    for name in ("first", "second"):
+        profile = yaml.safe_load(
+            (output_dir / f"{name}_profile.yml").read_text()
+        )
+        assert profile == {"name": name, "model-paths": ["models"]}
+
+        project_root = final_dir / f"{name}_profile"
+        assert (project_root / "models").is_dir()
+        assert (project_root / "packages.yml").exists()
@@ -1,10 +1,22 @@
 import os
 import json
 import yaml
-from typing import Dict
+from typing import Dict, Optional
 import logging
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader, CSafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as CSafeLoader, SafeDumper as CSafeDumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
 
 DEFAULT_PACKAGES = {
     "packages": [
@@ -15,6 +27,11 @@ DEFAULT_PACKAGES = {
     ]
 }
 
+# packages.yml is the same for every project, so serialize it only once
+_DEFAULT_PACKAGES_YAML = yaml.dump(
+    DEFAULT_PACKAGES, Dumper=CSafeDumper, sort_keys=False, encoding="utf-8"
+)
+
 
 class DBTProjectGenerator:
     """
@@ -31,13 +48,20 @@ class DBTProjectGenerator:
         final_dir (Path): Directory where the dbt
         project folder will be created.
         profiles (dict): Parsed contents of the
-        profile YAML file.
+        profile YAML file. Taken from the `profiles` argument
+        when given, so the file is not read again.
     """
 
-    def __init__(self, profile_file, final_dir):
+    def __init__(
+        self, profile_file, final_dir, profiles: Optional[Dict] = None
+    ):
         self.profile_file = Path(profile_file)
         self.final_dir = Path(final_dir)
-        self.profiles = self._read_file(self.profile_file, "yml")
+        self.profiles = (
+            profiles
+            if profiles is not None
+            else self._read_file(self.profile_file, "yml")
+        )
 
     def _read_file(self, file_path: str, file_type: str) -> Dict:
         """
@@ -50,20 +74,22 @@ class DBTProjectGenerator:
         Returns:
             Dict: The parsed file content as a Python dictionary.
         """
-        if not os.path.exists(file_path):
+        try:
+            f = open(file_path, "r", encoding="utf-8")
+        except FileNotFoundError as e:
             raise FileNotFoundError(
                 f"{file_type.upper()} file not found at {file_path}"
-            )
+            ) from e
 
-        with open(file_path, "r", encoding="utf-8") as f:
+        with f:
             if file_type.lower() == "yml":
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=CSafeLoader)
             elif file_type.lower() == "json":
-                data = json.load(f)
+                data = orjson.loads(f.read()) if orjson else json.load(f)
             else:
                 raise ValueError(f"Unsupported file type: {file_type}")
 
-        logging.info(f"{file_path}: Valid {file_type.upper()} data loaded.")
+        log.info("%s: Valid %s data loaded.", file_path, file_type.upper())
         return data
 
     def create_project(self):
@@ -83,36 +109,47 @@ class DBTProjectGenerator:
         Prints confirmation message with the
         project path upon success.
         """
-        logging.info(
-            f"create_project method called"
-            f"with profile_file: {self.profile_file} "
-            f"and final_dir: {self.final_dir}"
+        log.info(
+            "create_project method called "
+            "with profile_file: %s and final_dir: %s",
+            self.profile_file,
+            self.final_dir,
         )
 
         profile_name = os.path.splitext(os.path.basename(self.profile_file))[0]
 
         project_root = self.final_dir / profile_name
         project_root.mkdir(parents=True, exist_ok=True)
-        logging.info(f"Creating DBT project folder at {project_root}")
-
-        # Create directories based on keys with list values in profile
-        for key, paths in self.profiles.items():
-            if (
-                isinstance(paths, list)
-                and all(isinstance(p, str) for p in paths)
-            ):
-                for folder in paths:
-                    (project_root / folder).mkdir(parents=True, exist_ok=True)
+        log.info("Creating DBT project folder at %s", project_root)
+
+        # Create directories based on keys with list values in profile,
+        # once per unique path and parents first
+        dirs = {
+            project_root / folder
+            for paths in self.profiles.values()
+            if isinstance(paths, list)
+            and all(isinstance(p, str) for p in paths)
+            for folder in paths
+        }
+        for d in sorted(dirs, key=lambda p: len(p.parts)):
+            d.mkdir(parents=True, exist_ok=True)
 
         # Write dbt_project.yml
-        with open(project_root / "dbt_project.yml", "w") as f:
-            yaml.safe_dump(self.profiles, f, sort_keys=False)
+        (project_root / "dbt_project.yml").write_bytes(
+            yaml.dump(
+                self.profiles,
+                Dumper=CSafeDumper,
+                sort_keys=False,
+                encoding="utf-8",
+            )
+        )
 
         # Write packages.yml
-        with open(project_root / "packages.yml", "w") as f:
-            yaml.safe_dump(DEFAULT_PACKAGES, f, sort_keys=False)
+        (project_root / "packages.yml").write_bytes(_DEFAULT_PACKAGES_YAML)
 
-        logging.info(
-            f"DBT project '{profile_name}' created at "
-            f"{project_root.resolve()}"
-        )
+        if log.isEnabledFor(logging.INFO):
+            log.info(
+                "DBT project '%s' created at %s",
+                profile_name,
+                project_root.resolve(),
+            )
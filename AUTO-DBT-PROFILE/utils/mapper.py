@@ -3,7 +3,235 @@ import json
 import yaml
 import logging
 import re
-from typing import Dict
+import functools
+from typing import Dict, Optional
+
+try:
+    from yaml import CSafeLoader, CSafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as CSafeLoader, SafeDumper as CSafeDumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+_BOOL_MAPPING = {"yes": True, "no": False}
+
+# A {name} placeholder in the template
+_PLACEHOLDER = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+# Strings that YAML reads back unchanged when written without quotes
+_PLAIN_SCALAR = re.compile(r"[A-Za-z_/][A-Za-z0-9_ ./-]*(?<! )")
+_RESERVED_SCALARS = frozenset(
+    ["y", "n", "yes", "no", "on", "off", "true", "false", "null"]
+)
+
+# Line width large enough that the emitter never folds a value
+_NO_WRAP = 1 << 30
+
+
+def _parse_file(file_path: str, file_type: str) -> Dict:
+    """
+    Reads and parses a YAML or JSON file.
+
+    Args:
+        file_path (str): The full path to the input file.
+        file_type (str): The file type to parse, either 'yml' or 'json'.
+
+    Returns:
+        Dict: The parsed file content as a Python dictionary.
+    """
+    try:
+        f = open(file_path, "r", encoding="utf-8")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(
+            f"{file_type.upper()} file not found at {file_path}"
+        ) from e
+
+    with f:
+        if file_type.lower() == "yml":
+            data = yaml.load(f, Loader=CSafeLoader)
+        elif file_type.lower() == "json":
+            data = orjson.loads(f.read()) if orjson else json.load(f)
+        else:
+            raise ValueError(f"Unsupported file type: {file_type}")
+
+    log.info("%s: Valid %s data loaded.", file_path, file_type.upper())
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def _load_file(file_path: str, file_type: str) -> Dict:
+    """
+    Cached variant of `_parse_file` keyed on the absolute path,
+    so shared config and mapping files are parsed once per run.
+    The returned dictionary is shared and must not be mutated.
+    """
+    return _parse_file(file_path, file_type)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_txt(file_path: str) -> str:
+    """
+    Reads a plain text file once per run and returns its contents.
+
+    Args:
+        file_path (str): Absolute path to the text file.
+
+    Returns:
+        str: Content of the file.
+    """
+    try:
+        f = open(file_path, "r", encoding="utf-8")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(
+            f"TXT file not found at {file_path}"
+        ) from e
+
+    with f:
+        data = f.read()
+
+    log.info("%s: Template file loaded.", file_path)
+    return data
+
+
+def _write_bytes(
+    file_path: str, data: bytes, dir_fd: Optional[int] = None
+) -> None:
+    """
+    Writes an already encoded payload to a file with a single
+    open/write/close sequence, bypassing Python's buffered text layer.
+
+    Args:
+        file_path (str): Path of the file to create or overwrite,
+            relative to `dir_fd` when one is given.
+        data (bytes): The full file content.
+        dir_fd (int): Optional descriptor of an open directory.
+    """
+    fd = os.open(
+        file_path,
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+        0o644,
+        dir_fd=dir_fd,
+    )
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _yaml_scalar(value) -> str:
+    """
+    Formats a value as an inline YAML scalar. Plain-safe strings are
+    written as-is; other strings are left to PyYAML as double-quoted
+    scalars and anything that is not a scalar as flow style, so YAML
+    escapes (e.g. \\U0001F600) are used rather than JSON ones.
+
+    Args:
+        value: The value to format.
+
+    Returns:
+        str: The YAML representation of the value.
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        # Same spelling as PyYAML's represent_float
+        if value != value:
+            return ".nan"
+        if value in (float("inf"), float("-inf")):
+            return ".inf" if value > 0 else "-.inf"
+        text = repr(value).lower()
+        if "." not in text and "e" in text:
+            text = text.replace("e", ".0e", 1)
+        return text
+    if (
+        isinstance(value, str)
+        and _PLAIN_SCALAR.fullmatch(value)
+        and value.lower() not in _RESERVED_SCALARS
+    ):
+        return value
+
+    text = yaml.dump(
+        value,
+        Dumper=CSafeDumper,
+        default_style='"' if isinstance(value, str) else None,
+        default_flow_style=True,
+        width=_NO_WRAP,
+    )
+    if text.endswith("\n...\n"):
+        text = text[: -len("\n...\n")]
+    return text.rstrip("\n")
+
+
+def _emit_vars(var_json: Dict, key_indent: int = 8, list_indent: int = 10):
+    """
+    Emits the entries of the profile `vars` block as YAML text,
+    already indented for its position in the template.
+
+    Args:
+        var_json (dict): Variables to emit.
+        key_indent (int): Indentation of each variable name.
+        list_indent (int): Indentation of list items.
+
+    Returns:
+        str: The indented YAML lines.
+    """
+    key_pad = " " * key_indent
+    item_pad = " " * list_indent
+    parts = []
+    for k, value in var_json.items():
+        if isinstance(value, list) and value:
+            parts.append(f"{key_pad}{_yaml_scalar(k)}:\n")
+            for item in value:
+                parts.append(f"{item_pad}- {_yaml_scalar(item)}\n")
+        else:
+            parts.append(
+                f"{key_pad}{_yaml_scalar(k)}: {_yaml_scalar(value)}\n"
+            )
+    return "".join(parts)
+
+
+def _flatten(d: Dict, prefix: str = ""):
+    """
+    Yields (dotted_key, value) pairs for every scalar leaf of a
+    nested dictionary, e.g. {"a": {"b": 1}} yields ("a.b", 1).
+
+    Args:
+        d (dict): The dictionary to flatten.
+        prefix (str): Dotted prefix of the enclosing keys.
+    """
+    for k, v in d.items():
+        if isinstance(v, dict):
+            yield from _flatten(v, f"{prefix}{k}.")
+        else:
+            yield f"{prefix}{k}", v
+
+
+@functools.lru_cache(maxsize=None)
+def _load_flat_mapping(file_path: str) -> Dict:
+    """
+    Loads a YAML mapping file and flattens it into a
+    {dotted_key: value} dict, once per run per absolute path.
+    The returned dictionary is shared and must not be mutated.
+
+    Args:
+        file_path (str): Absolute path to the mapping file.
+
+    Returns:
+        Dict: The flattened mapping.
+    """
+    mapping_data = _load_file(file_path, "yml")
+    return dict(_flatten(mapping_data or {}))
 
 
 class TemplateProcessor:
@@ -17,11 +245,13 @@ class TemplateProcessor:
         json_input_file (str): Path to the input JSON file
             containing user data.
         output_dir (str): Directory where the final output will be saved.
+        output_dir_fd (int): Optional open descriptor of `output_dir`,
+            used to write the profile without re-resolving the path.
         mapping_file (str): Path to the YAML mapping file.
         template_file (str): Path to the template text file for
             rendering.
         intermediate_dir (str): Directory where intermediate
-            JSON will be saved.
+            JSON will be saved. Optional; nothing is written if unset.
         mapping_data (dict): Data from the mapping file.
         template_str (str): Template text loaded as a string.
         input_data (dict): Input JSON data loaded from file.
@@ -29,24 +259,41 @@ class TemplateProcessor:
             applying mappings.
     """
 
-    def __init__(self, config_file: str, json_input_file: str):
+    def __init__(
+        self,
+        config_file: str,
+        json_input_file: str,
+        dict_config_data: Optional[Dict] = None,
+        output_dir_fd: Optional[int] = None,
+    ):
         self.config_file = config_file
         self.json_input_file = json_input_file
-        self.dict_config_data = self._read_file(config_file, "yml")
+        self.dict_config_data = (
+            dict_config_data
+            if dict_config_data is not None
+            else self._read_file(config_file, "yml")
+        )
 
         self.output_dir = self.dict_config_data.get("output_dir")
+        self.output_dir_fd = output_dir_fd
         self.mapping_file = self.dict_config_data.get("mapping_file")
         self.template_file = self.dict_config_data.get("template_file")
         self.intermediate_dir = self.dict_config_data.get("updated_input_dir")
+        self._write_intermediate = bool(self.intermediate_dir)
 
         self.mapping_data = self._read_file(self.mapping_file, "yml")
+        self._flat_mapping = _load_flat_mapping(
+            os.path.abspath(self.mapping_file)
+        )
         self.template_str = self._read_txt(self.template_file)
-        self.input_data = self._read_file(self.json_input_file, "json")
+        self._placeholders = frozenset(_PLACEHOLDER.findall(self.template_str))
+        self.input_data = _parse_file(self.json_input_file, "json")
         self.intermediate_input = {}
 
     def _read_file(self, file_path: str, file_type: str) -> Dict:
         """
-        Reads and parses a YAML or JSON file.
+        Reads and parses a YAML or JSON file, reusing the result
+        of any earlier read of the same file.
 
         Args:
             file_path (str): The full path to the input file.
@@ -55,25 +302,12 @@ class TemplateProcessor:
         Returns:
             Dict: The parsed file content as a Python dictionary.
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(
-                f"{file_type.upper()} file not found at {file_path}"
-            )
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            if file_type.lower() == "yml":
-                data = yaml.safe_load(f)
-            elif file_type.lower() == "json":
-                data = json.load(f)
-            else:
-                raise ValueError(f"Unsupported file type: {file_type}")
-
-        logging.info(f"{file_path}: Valid {file_type.upper()} data loaded.")
-        return data
+        return _load_file(os.path.abspath(file_path), file_type.lower())
 
     def _read_txt(self, file_path: str) -> str:
         """
-        Reads a plain text file and returns its contents as a string.
+        Reads a plain text file and returns its contents as a string,
+        reusing the result of any earlier read of the same file.
 
         Args:
             file_path (str): Path to the text file.
@@ -81,29 +315,7 @@ class TemplateProcessor:
         Returns:
             str: Content of the file.
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"TXT file not found at {file_path}")
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = f.read()
-
-        logging.info(f"{file_path}: Template file loaded.")
-        return data
-
-    def indent_yaml_block(self, yaml_str: str, base_indent: int = 8) -> str:
-        lines = yaml_str.splitlines()
-        result = []
-        key_indent = base_indent
-        list_indent = base_indent + 2
-
-        for line in lines:
-            stripped = line.lstrip()
-            if stripped.startswith("-"):
-                result.append(" " * list_indent + stripped)
-            else:
-                result.append(" " * key_indent + stripped)
-
-        return "\n".join(result) + "\n"
+        return _load_txt(os.path.abspath(file_path))
 
     def render_mappings(self):
         """
@@ -115,82 +327,94 @@ class TemplateProcessor:
         """
         updated_json = {}
         unknown_json = {}
-        bool_mapping = {"yes": True, "no": False}
+        apply = self._apply
 
         for json_key, json_value in self.input_data.items():
             if json_key == "user_set_variables":
                 for lv_key, lv_value in json_value.items():
-                    value = self._extract_value(lv_key) or "unknown"
-                    if value == "unknown":
-                        unknown_json[lv_key] = lv_value
-                        updated_json[value] = unknown_json
-                    else:
-                        updated_json[value] = (
-                            bool_mapping.get(lv_value, lv_value)
-                            if isinstance(lv_value, str)
-                            else lv_value
-                        )
+                    apply(lv_key, lv_value, updated_json, unknown_json)
             else:
-                value = self._extract_value(json_key) or "unknown"
-                if value == "unknown":
-                    unknown_json[json_key] = json_value
-                    updated_json[value] = unknown_json
-                else:
-                    updated_json[value] = (
-                        bool_mapping.get(json_value, json_value)
-                        if isinstance(json_value, str)
-                        else json_value
-                    )
+                apply(json_key, json_value, updated_json, unknown_json)
+
+        if unknown_json:
+            updated_json["unknown"] = unknown_json
 
         self.intermediate_input = updated_json
-        intermediate_file = os.path.join(
-            self.intermediate_dir,
-            "updated_" + os.path.basename(self.json_input_file),
-        )
 
-        with open(intermediate_file, "w") as f:
-            json.dump(updated_json, f, indent=2)
+        # The intermediate JSON is only a debugging aid
+        if self._write_intermediate:
+            intermediate_file = os.path.join(
+                self.intermediate_dir,
+                "updated_" + os.path.basename(self.json_input_file),
+            )
+            _write_bytes(
+                intermediate_file,
+                orjson.dumps(updated_json, option=orjson.OPT_INDENT_2)
+                if orjson
+                else json.dumps(updated_json, indent=2).encode("utf-8"),
+            )
+
+        log.info("render_mappings to the variable is success!")
+
+    def _apply(self, key: str, value, updated: Dict, unknown: Dict):
+        """
+        Stores one input entry under its mapped name in `updated`,
+        converting "yes"/"no" strings to booleans, or under its
+        original key in `unknown` when the key is not mapped.
 
-        logging.info("render_mappings to the variable is success!")
+        Args:
+            key (str): The input key from JSON.
+            value: The input value.
+            updated (dict): Mapped entries collected so far.
+            unknown (dict): Unmapped entries collected so far.
+        """
+        mapped_key = self._extract_value(key)
+        if mapped_key:
+            updated[mapped_key] = (
+                _BOOL_MAPPING.get(value, value)
+                if isinstance(value, str)
+                else value
+            )
+        else:
+            unknown[key] = value
 
     def create_dbt_profile(self) -> str:
         """
         Rendering the mappings and create a new input
         file with matched string from the mappings
         """
-        rendered = self.template_str
+        values = {}
         var_json = {}
-
         for json_key, json_value in self.intermediate_input.items():
             if json_key == "unknown":
                 continue
-            elif re.search(json_key, rendered):
-                rendered = rendered.replace(
-                    "{" + json_key + "}", str(json_value)
-                )
+            elif json_key in self._placeholders:
+                values[json_key] = str(json_value)
             else:
                 var_json[json_key] = json_value
 
-        yaml_string = yaml.dump(
-            var_json, default_flow_style=False, sort_keys=False
+        values.setdefault(
+            "vars_block", f"vars:\n{_emit_vars(var_json)}" if var_json else ""
         )
-        indented_yaml = self.indent_yaml_block(yaml_string)
-        vars_block = (
-            f"vars:\n{indented_yaml}" if indented_yaml.strip() != "{}" else ""
-        )
-
-        rendered = rendered.replace("{vars_block}", vars_block)
-        rendered = rendered.replace("{project_name}", "Default project name")
+        values.setdefault("project_name", "Default project name")
 
-        output_file = os.path.join(
-            self.output_dir,
-            os.path.splitext(
-                os.path.basename(self.json_input_file)
-            )[0] + "_profile.yml",
+        # Fill every placeholder in a single pass over the template,
+        # leaving unknown ones and any other braces untouched
+        rendered = _PLACEHOLDER.sub(
+            lambda m: values.get(m.group(1), m.group(0)), self.template_str
         )
 
-        with open(output_file, "w") as file:
-            file.write(rendered)
+        output_name = os.path.splitext(
+            os.path.basename(self.json_input_file)
+        )[0] + "_profile.yml"
+        output_file = os.path.join(self.output_dir, output_name)
+
+        if self.output_dir_fd is not None:
+            _write_bytes(
+                output_name, rendered.encode("utf-8"), self.output_dir_fd
+            )
+        else:
+            _write_bytes(output_file, rendered.encode("utf-8"))
         return output_file
 
     def _extract_value(self, json_key: str):
@@ -204,12 +428,9 @@ class TemplateProcessor:
         Returns:
             str: Corresponding mapped value or empty string if not found.
         """
-        keys = json_key.split(".")
-        value = self.mapping_data
-        try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            logging.warning(f"Key '{json_key}' not found in mapped data.")
+        value = self._flat_mapping.get(json_key)
+        if value is None:
+            if log.isEnabledFor(logging.WARNING):
+                log.warning("Key '%s' not found in mapped data.", json_key)
             return ""
+        return value